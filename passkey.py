@@ -13,22 +13,40 @@ License: GPL-3.0
 
 import argparse
 import configparser
+import contextlib
 import json
 import csv
 import hashlib
 import os
 import sys
 import re
+import shutil
 import gzip
+import heapq
+import tempfile
+import io
+import mmap
 import urllib.request
 import urllib.error
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Iterable, Iterator
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import itertools
+import functools
+import multiprocessing
+import collections
+import collections.abc
 from collections import Counter
 import time
+import math
+import random
+
+# Optional faster JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __version__ = "2.0.0"
 __author__ = "PassKey Security Team"
@@ -37,6 +55,37 @@ __license__ = "GPL-3.0"
 # Global configuration
 CONFIG = {}
 
+# Write buffer size for wordlist exports
+EXPORT_BUFFER_SIZE = 1 << 20
+TXT_CHUNK_LINES = 65536
+GZIP_BUFFER_SIZE = 64 * 1024
+
+# Minimum number of passwords before work is spread over a process pool
+PARALLEL_THRESHOLD = 100_000
+
+# Number of generated passwords that get leet speak variants
+LEET_SAMPLE_SIZE = 5000
+
+# Words that seed improve_wordlist case variations; the leet/year stages
+# use half as many and the suffix stages 30%
+IMPROVE_SEED_WORDS = 1000
+
+# Probes per Bloom filter item; fewer probes than optimal trade bits for speed
+BLOOM_MAX_HASHES = 6
+
+# Lines sorted in memory per temporary run when merging in low-memory mode
+MERGE_RUN_LINES = 1_000_000
+MERGE_FAN_IN = 64
+
+# Strips everything but digits from phone numbers
+_DIGITS_RE = re.compile(r'\D')
+
+# Character class bits used by the PasswordConfig lookup table
+CHAR_UPPER = 1
+CHAR_LOWER = 2
+CHAR_DIGIT = 4
+CHAR_SPECIAL = 8
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -96,6 +145,7 @@ def read_config(filename: str = "passkey.cfg") -> bool:
                 leet[letter] = config.get("leet", letter, fallback=default_config["LEET"].get(letter, letter))
             
             CONFIG["LEET"] = leet
+            CONFIG["LEET_TABLE"] = str.maketrans(leet)
             
             print(f"{Colors.GREEN}[✓] Configuration loaded from {filename}{Colors.ENDC}")
             return True
@@ -104,10 +154,12 @@ def read_config(filename: str = "passkey.cfg") -> bool:
             print(f"{Colors.YELLOW}[!] Error reading config: {e}{Colors.ENDC}")
             print(f"{Colors.YELLOW}[!] Using default configuration{Colors.ENDC}")
             CONFIG.update(default_config)
+            CONFIG["LEET_TABLE"] = str.maketrans(CONFIG["LEET"])
             return False
     else:
         # Use default config
         CONFIG.update(default_config)
+        CONFIG["LEET_TABLE"] = str.maketrans(CONFIG["LEET"])
         # Create default config file
         create_default_config(filename)
         return True
@@ -199,11 +251,31 @@ class PasswordConfig:
         self.use_special_chars = True
         self.use_numbers = True
         self.use_modern_terms = True
+        self.use_gzip = False
+        self.pretty_json = False
+        self.low_memory = False
+        self.assume_yes = False
+        self.sample_size: Optional[int] = None
         self.year_range = [str(y) for y in range(1950, 2026)]
         self.special_chars = CONFIG["global"]["chars"]
         self.modern_terms = CONFIG["global"]["modern_terms"]
         self.num_from = CONFIG["global"]["numfrom"]
         self.num_to = CONFIG["global"]["numto"]
+        
+        # Character class lookup, indexed by byte value (ASCII only)
+        self._special_set = frozenset(self.special_chars)
+        lut = bytearray(256)
+        for i in range(128):
+            c = chr(i)
+            if c.isupper():
+                lut[i] |= CHAR_UPPER
+            if c.islower():
+                lut[i] |= CHAR_LOWER
+            if c.isdigit():
+                lut[i] |= CHAR_DIGIT
+            if c in self._special_set:
+                lut[i] |= CHAR_SPECIAL
+        self._class_lut = bytes(lut)
 
 class ProgressBar:
     """Simple progress bar for terminal"""
@@ -213,11 +285,17 @@ class ProgressBar:
         self.current = 0
         self.description = description
         self.start_time = time.time()
+        # Redraw at most ~100 times over the whole run
+        self._step = max(1, total // 100)
+        self._last_displayed = 0
+        self._write = sys.stdout.write
     
     def update(self, amount: int = 1):
         """Update progress bar"""
         self.current += amount
-        self.display()
+        if self.current - self._last_displayed >= self._step or self.current >= self.total:
+            self._last_displayed = self.current
+            self.display()
     
     def display(self):
         """Display progress bar"""
@@ -230,12 +308,276 @@ class ProgressBar:
         
         elapsed = time.time() - self.start_time
         
-        sys.stdout.write(f'\r{Colors.CYAN}[{bar}] {percent:.1f}% {Colors.ENDC}{self.description} ({self.current}/{self.total})')
+        self._write(f'\r{Colors.CYAN}[{bar}] {percent:.1f}% {Colors.ENDC}{self.description} ({self.current}/{self.total})')
         sys.stdout.flush()
         
         if self.current >= self.total:
             print()
 
+def _char_classes(password: str, class_lut: bytes, special_set: frozenset) -> Tuple[int, int]:
+    """Return the CHAR_* class mask and the unique character count in a single pass"""
+    if password.isascii():
+        # Encode once and let bytes.translate/set do the per-byte work in C;
+        # only the few distinct class values are combined in Python
+        encoded = password.encode()
+        mask = 0
+        for classes in set(encoded.translate(class_lut)):
+            mask |= classes
+        return mask, len(set(encoded))
+    
+    # Unicode fallback: classify each distinct character once
+    chars = set(password)
+    mask = 0 if special_set.isdisjoint(chars) else CHAR_SPECIAL
+    for c in chars:
+        if c.isupper():
+            mask |= CHAR_UPPER
+        elif c.islower():
+            mask |= CHAR_LOWER
+        if c.isdigit():
+            mask |= CHAR_DIGIT
+    return mask, len(chars)
+
+def _score_strength(password: str, mask: int, unique: int) -> str:
+    """Map password length, character class mask and uniqueness to a strength label"""
+    length = len(password)
+    score = (
+        # Length
+        (length >= 8) + (length >= 12) + (length >= 16)
+        # Character variety
+        + bool(mask & CHAR_UPPER) + bool(mask & CHAR_LOWER) + bool(mask & CHAR_DIGIT)
+        + 2 * bool(mask & CHAR_SPECIAL)
+        # Complexity: high uniqueness
+        + (unique > length * 0.7)
+    )
+    
+    if score <= 3:
+        return "weak"
+    elif score <= 6:
+        return "medium"
+    else:
+        return "strong"
+
+def _annotate_password(password: str, class_lut: bytes, special_set: frozenset) -> list:
+    """Build the CSV row for one password (module level so worker processes can pickle it)"""
+    mask, unique = _char_classes(password, class_lut, special_set)
+    return [password, len(password), _score_strength(password, mask, unique),
+            bool(mask & CHAR_UPPER), bool(mask & CHAR_LOWER),
+            bool(mask & CHAR_DIGIT), bool(mask & CHAR_SPECIAL)]
+
+@contextlib.contextmanager
+def _batched_stdout() -> Iterator[None]:
+    """Collect prints in memory and write them to stdout in a single call"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+def _leet_words(words: List[str], leet_table: Dict[int, str]) -> List[str]:
+    """Lowercase and leet-translate many words with one str.translate call"""
+    if not words:
+        return []
+    # A per-word translate rebuilds its lookup cache every call; one pass over the joined text does not
+    return '\n'.join(words).lower().translate(leet_table).split('\n')
+
+def _read_wordlist(path: str) -> List[str]:
+    """Read the stripped, non-empty lines of a wordlist file through mmap"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        # Decode the mapped file once and split in C instead of iterating a text stream
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[:].decode('utf-8', 'ignore')
+    # Universal newlines only, like a text stream; str.splitlines() also splits on \x0c, \x85, \u2028, ...
+    return [w for w in map(str.strip, text.replace('\r', '\n').split('\n')) if w]
+
+def _concat_product(lefts: Iterable[str], rights: Iterable[str], min_len: int, max_len: int,
+                    swap: bool = False) -> Iterator[str]:
+    """Concatenate every left/right pair whose combined length is within bounds
+    
+    Right operands are bucketed by length, so the length check runs once per
+    bucket instead of once per pair. With ``swap`` the right operand comes first.
+    Pairs are produced lazily, one left operand at a time.
+    """
+    buckets: Dict[int, List[str]] = {}
+    for r in rights:
+        buckets.setdefault(len(r), []).append(r)
+    
+    def rows() -> Iterator[List[str]]:
+        for l in lefts:
+            n = len(l)
+            for length, group in buckets.items():
+                if min_len <= n + length <= max_len:
+                    if swap:
+                        yield [r + l for r in group]
+                    else:
+                        yield [l + r for r in group]
+    
+    return itertools.chain.from_iterable(rows())
+
+def _merge_runs(paths: List[str]) -> Iterator[str]:
+    """Yield the distinct lines of several sorted run files in sorted order"""
+    files = [open(path, encoding='utf-8', newline='\n', buffering=EXPORT_BUFFER_SIZE) for path in paths]
+    try:
+        # Compare without the newline so the merge order matches sorted()
+        last = None
+        for item in heapq.merge(*((line[:-1] for line in f) for f in files)):
+            if item != last:
+                yield item
+                last = item
+    finally:
+        for f in files:
+            f.close()
+
+def _sorted_unique(items: Iterable[str], run_lines: int = MERGE_RUN_LINES) -> Iterator[str]:
+    """Yield the distinct items in sorted order through an external merge sort
+    
+    At most ``run_lines`` items are held in memory at once. Each sorted run is
+    spilled to a temporary file, and the runs are combined with heapq.merge so
+    duplicates end up adjacent. Items must not contain newlines.
+    """
+    items = iter(items)
+    with tempfile.TemporaryDirectory(prefix='passkey-') as tmpdir:
+        runs: List[str] = []
+        names = itertools.count()
+        
+        def spill(lines: Iterable[str]) -> None:
+            path = os.path.join(tmpdir, f"run{next(names)}.txt")
+            with open(path, 'w', encoding='utf-8', newline='\n', buffering=EXPORT_BUFFER_SIZE) as f:
+                for chunk in iter(lambda: list(itertools.islice(lines, TXT_CHUNK_LINES)), []):
+                    f.write('\n'.join(chunk))
+                    f.write('\n')
+            runs.append(path)
+        
+        for chunk in iter(lambda: list(itertools.islice(items, run_lines)), []):
+            spill(iter(sorted(set(chunk))))
+        
+        # Merge in passes of at most MERGE_FAN_IN runs to stay under the open file limit
+        while len(runs) > MERGE_FAN_IN:
+            batches = [runs[i:i + MERGE_FAN_IN] for i in range(0, len(runs), MERGE_FAN_IN)]
+            runs = []
+            for batch in batches:
+                spill(_merge_runs(batch))
+                for path in batch:
+                    os.remove(path)
+        
+        yield from _merge_runs(runs)
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    """Write buffers to a file descriptor with os.writev, finishing any partial write"""
+    written = os.writev(fd, buffers)
+    if written < sum(map(len, buffers)):
+        rest = memoryview(b''.join(buffers))[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+class BloomFilter:
+    """Fixed-size Bloom filter for memory-bounded deduplication
+    
+    Membership tests can yield false positives at roughly ``error_rate``,
+    so a small fraction of unique passwords may be treated as duplicates.
+    Positions come from the built-in str hash, which is cached on each
+    string but differs between processes, so a filter is never persisted.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-5):
+        capacity = max(1, capacity)
+        # Each probe is Python work per item, so cap k and size the bit array for it
+        optimal = max(1, round(-math.log(error_rate) / math.log(2)))
+        self.num_hashes = min(optimal, BLOOM_MAX_HASHES)
+        rate = -math.log1p(-error_rate ** (1 / self.num_hashes))
+        self.num_bits = max(8, math.ceil(capacity * self.num_hashes / rate))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str) -> range:
+        """Unreduced bit positions for an item (double hashing over its str hash)"""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h2 = ((h * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) | 1
+        return range(h, h + self.num_hashes * h2, h2)
+    
+    def __contains__(self, item: str) -> bool:
+        # Stops at the first clear bit, which for a new item is usually within a few probes
+        bits, num_bits = self.bits, self.num_bits
+        for p in self._positions(item):
+            p %= num_bits
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def add(self, item: str):
+        """Add an item to the filter"""
+        bits, num_bits = self.bits, self.num_bits
+        for p in self._positions(item):
+            p %= num_bits
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+    
+    def update(self, items: Iterable[str]):
+        """Add several items to the filter"""
+        for item in items:
+            self.add(item)
+
+class PasswordStats:
+    """Wordlist statistics accumulated in a single pass over a password stream
+    
+    Passwords are counted by (length, class mask, strength), so memory depends
+    on the number of distinct keys rather than on the number of passwords.
+    """
+    
+    def __init__(self, class_lut: bytes, special_set: frozenset):
+        self.class_lut = class_lut
+        self.special_set = special_set
+        self.counts: Counter = Counter()
+    
+    def track(self, passwords: Iterable[str]) -> Iterator[str]:
+        """Pass passwords through unchanged while counting them"""
+        counts, class_lut, special_set = self.counts, self.class_lut, self.special_set
+        for pwd in passwords:
+            mask, unique = _char_classes(pwd, class_lut, special_set)
+            counts[len(pwd), mask, _score_strength(pwd, mask, unique)] += 1
+            yield pwd
+    
+    def to_dict(self) -> Dict:
+        """Summarise the counted passwords in the generate_statistics format"""
+        total = sum(self.counts.values())
+        if not total:
+            return {}
+        
+        length_counts = Counter()
+        strength_dist = Counter()
+        mask_counts = Counter()
+        for (length, mask, strength), count in self.counts.items():
+            length_counts[length] += count
+            strength_dist[strength] += count
+            mask_counts[mask] += count
+        
+        char_types = {
+            name: sum(count for mask, count in mask_counts.items() if mask & bit)
+            for name, bit in (('upper', CHAR_UPPER), ('lower', CHAR_LOWER),
+                              ('digit', CHAR_DIGIT), ('special', CHAR_SPECIAL))
+        }
+        
+        avg_length = sum(length * count for length, count in length_counts.items()) / total
+        
+        return {
+            'total_passwords': total,
+            'average_length': round(avg_length, 2),
+            'min_length': min(length_counts),
+            'max_length': max(length_counts),
+            'strength_distribution': dict(strength_dist),
+            'weak_percentage': round(strength_dist.get('weak', 0) / total * 100, 2),
+            'medium_percentage': round(strength_dist.get('medium', 0) / total * 100, 2),
+            'strong_percentage': round(strength_dist.get('strong', 0) / total * 100, 2),
+            'char_type_distribution': char_types,
+            'generation_timestamp': datetime.now().isoformat()
+        }
+
 class PassKey:
     """Main PassKey password generator class"""
     
@@ -367,10 +709,7 @@ class PassKey:
     
     def make_leet(self, word: str) -> str:
         """Convert string to leet speak"""
-        leet_word = word.lower()
-        for letter, leet_char in CONFIG["LEET"].items():
-            leet_word = leet_word.replace(letter, leet_char)
-        return leet_word
+        return word.lower().translate(CONFIG["LEET_TABLE"])
     
     def generate_base_words(self, profile: Profile) -> List[str]:
         """Generate base words from profile"""
@@ -423,24 +762,27 @@ class PassKey:
             # Email variations
             words.extend([username.replace('.', ''), username.replace('_', '')])
         
-        # Reverse words
-        for word in words[:]:
-            if len(word) > 3:
-                words.append(word[::-1])
+        # Deduplicate in insertion order so later slices of the base words are reproducible
+        words = list(dict.fromkeys(words))
         
-        return list(set(words))
+        # Reverse words (the list is built before extending, so only originals are reversed)
+        words.extend([w[::-1] for w in words if len(w) > 3])
+        
+        return list(dict.fromkeys(words))
     
-    def generate_date_variations(self, date: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def generate_date_variations(date: str) -> Tuple[str, ...]:
         """Generate date variations from DDMMYYYY format"""
         if not date or len(date) != 8:
-            return []
+            return ()
         
-        variations = []
         dd, mm, yyyy = date[:2], date[2:4], date[4:]
         yy = yyyy[2:]
         yyy = yyyy[1:]
         
-        variations.extend([
+        # dict.fromkeys keeps a stable order for reproducible wordlists
+        return tuple(dict.fromkeys([
             dd, mm, yyyy, yy, yyy,
             dd + mm, mm + dd,
             dd + mm + yyyy, mm + dd + yyyy,
@@ -448,27 +790,71 @@ class PassKey:
             yyyy + mm + dd, yyyy + dd + mm,
             yy + mm + dd, yy + dd + mm,
             dd[1], mm[1]  # Single digit
-        ])
-        
-        return list(set(variations))
+        ]))
     
-    def generate_combinations(self, profile: Profile) -> Set[str]:
-        """Generate all password combinations with progress tracking"""
-        passwords = set()
+    def estimate_combinations(self, profile: Profile) -> int:
+        """Upper bound on the number of candidates generated for a profile"""
+        base = len(self.generate_base_words(profile))
+        dates = len(set(itertools.chain.from_iterable(
+            self.generate_date_variations(d)
+            for d in [profile.birthdate, profile.partner_birthdate, profile.child_birthdate])))
+        years = len(self.config.year_range[-10:])
+        return (base * (1 + 6 * dates + 6 * years)
+                + 50 * 2 * 10 + 50 * 5 * 5 + 20 * 15 * 3 + 4 + 3
+                + LEET_SAMPLE_SIZE)
+    
+    def iter_combinations(self, profile: Profile, seen=None) -> Iterator[str]:
+        """Yield unique password combinations stage by stage
+        
+        ``seen`` is any container with ``in``, ``add`` and ``update`` (a set
+        or a BloomFilter); it ends up holding every yielded password.
+        """
+        if seen is None:
+            seen = set()
+        # Uniform sample over every stage; the fixed seed keeps reruns identical
+        leet_sample: List[str] = []
+        leet_rng = random.Random(0)
+        emitted = next_pick = 0
+        weight = 1.0
+        
+        def log_uniform() -> float:
+            return math.log(leet_rng.random() or sys.float_info.min)
+        
+        def emit(stage: Iterable[str]) -> Iterator[str]:
+            nonlocal emitted, next_pick, weight
+            # Deduplicate in batches, so no stage is ever held in memory whole
+            stage = iter(stage)
+            for batch in iter(lambda: list(itertools.islice(stage, TXT_CHUNK_LINES)), []):
+                fresh = [p for p in dict.fromkeys(batch) if p not in seen]
+                seen.update(fresh)
+                
+                # Reservoir sampling (Algorithm L): once the sample is full, jump
+                # straight to the next candidate that replaces a random slot
+                room = LEET_SAMPLE_SIZE - len(leet_sample)
+                if room > 0:
+                    leet_sample.extend(fresh[:room])
+                    if len(leet_sample) == LEET_SAMPLE_SIZE:
+                        weight = math.exp(log_uniform() / LEET_SAMPLE_SIZE)
+                        next_pick = LEET_SAMPLE_SIZE + math.floor(log_uniform() / math.log1p(-weight))
+                end = emitted + len(fresh)
+                while len(leet_sample) == LEET_SAMPLE_SIZE and next_pick < end:
+                    leet_sample[leet_rng.randrange(LEET_SAMPLE_SIZE)] = fresh[next_pick - emitted]
+                    weight *= math.exp(log_uniform() / LEET_SAMPLE_SIZE)
+                    next_pick += math.floor(log_uniform() / math.log1p(-weight)) + 1
+                emitted = end
+                yield from fresh
         
         print(f"\n{Colors.CYAN}[*] Generating base words...{Colors.ENDC}")
         base_words = self.generate_base_words(profile)
         print(f"{Colors.GREEN}[✓] Generated {len(base_words)} base words{Colors.ENDC}")
         
         print(f"{Colors.CYAN}[*] Generating date variations...{Colors.ENDC}")
-        dates = []
-        for date_field in [profile.birthdate, profile.partner_birthdate, profile.child_birthdate]:
-            dates.extend(self.generate_date_variations(date_field))
-        dates = list(set(dates))
+        date_fields = [profile.birthdate, profile.partner_birthdate, profile.child_birthdate]
+        dates = list(dict.fromkeys(itertools.chain.from_iterable(
+            self.generate_date_variations(d) for d in date_fields)))
         print(f"{Colors.GREEN}[✓] Generated {len(dates)} date variations{Colors.ENDC}")
         
         # Years
-        current_year = datetime.now().year
         years = self.config.year_range[-10:]  # Last 10 years
         
         print(f"\n{Colors.CYAN}[*] Creating combinations...{Colors.ENDC}")
@@ -477,164 +863,181 @@ class PassKey:
         total_ops = len(base_words) + len(base_words) * len(dates) + len(base_words) * len(years)
         progress = ProgressBar(total_ops, "Generating passwords")
         
+        # Config values used in the loops below, bound once
+        min_len, max_len = self.config.min_length, self.config.max_length
+        specials = tuple(self.config.special_chars[:5])
+        modern = tuple(self.config.modern_terms[:15])
+        
+        # Every stage skips candidates outside the length bounds, so the
+        # output needs no separate filtering pass
+        
         # Base words alone
-        passwords.update(base_words)
+        yield from emit([w for w in base_words if min_len <= len(w) <= max_len])
         progress.update(len(base_words))
         
         # Words + dates with separators
         separators = ['', '_', '-', '.', '@', '!']
-        for word in base_words:
-            for date in dates:
-                for sep in separators[:3]:  # Limit separators
-                    passwords.add(f"{word}{sep}{date}")
-                    passwords.add(f"{date}{sep}{word}")
-            progress.update(1)
+        seps = separators[:3]  # Limit separators
+        word_seps = [w + s for w, s in itertools.product(base_words, seps)]
+        sep_dates = [d + s for s, d in itertools.product(seps, dates)]
+        yield from emit(_concat_product(word_seps, dates, min_len, max_len))
+        yield from emit(_concat_product(base_words, sep_dates, min_len, max_len, swap=True))
+        progress.update(len(base_words) * len(dates))
         
         # Words + years
-        for word in base_words:
-            for year in years:
-                for sep in separators[:3]:
-                    passwords.add(f"{word}{sep}{year}")
-                    passwords.add(f"{year}{sep}{word}")
-            progress.update(1)
+        sep_years = [y + s for s, y in itertools.product(seps, years)]
+        yield from emit(_concat_product(word_seps, years, min_len, max_len))
+        yield from emit(_concat_product(base_words, sep_years, min_len, max_len, swap=True))
+        progress.update(len(base_words) * len(years))
         
         # Words + numbers
         if self.config.use_numbers:
             print(f"\n{Colors.CYAN}[*] Adding number combinations...{Colors.ENDC}")
-            for word in base_words[:50]:  # Limit to prevent explosion
-                for num in [str(n) for n in range(self.config.num_from, min(self.config.num_to, 100), 11)]:
-                    passwords.add(f"{word}{num}")
-                    passwords.add(f"{num}{word}")
+            nums = [str(n) for n in range(self.config.num_from, min(self.config.num_to, 100), 11)]
+            top_words = base_words[:50]  # Limit to prevent explosion
+            yield from emit(itertools.chain(
+                _concat_product(top_words, nums, min_len, max_len),
+                _concat_product(top_words, nums, min_len, max_len, swap=True)))
         
         # Special characters
         if self.config.use_special_chars:
             print(f"{Colors.CYAN}[*] Adding special characters...{Colors.ENDC}")
-            for word in base_words[:50]:
-                for char in self.config.special_chars[:5]:
-                    passwords.add(f"{word}{char}")
-                    passwords.add(f"{char}{word}")
-                    for year in years[-3:]:
-                        passwords.add(f"{word}{char}{year}")
+            top_words = base_words[:50]
+            word_chars = [w + c for w, c in itertools.product(top_words, specials)]
+            yield from emit(itertools.chain(
+                _concat_product(top_words, specials, min_len, max_len),
+                _concat_product(top_words, specials, min_len, max_len, swap=True),
+                _concat_product(word_chars, years[-3:], min_len, max_len)))
         
         # Modern terms
         if self.config.use_modern_terms:
             print(f"{Colors.CYAN}[*] Adding modern terms (2025 trends)...{Colors.ENDC}")
-            for word in base_words[:20]:
-                for term in self.config.modern_terms[:15]:
-                    passwords.add(f"{word}{term}")
-                    passwords.add(f"{term}{word}")
-                    passwords.add(f"{word}{term.capitalize()}")
+            top_words = base_words[:20]
+            yield from emit(itertools.chain(
+                _concat_product(top_words, modern, min_len, max_len),
+                _concat_product(top_words, modern, min_len, max_len, swap=True),
+                _concat_product(top_words, [t.capitalize() for t in modern], min_len, max_len)))
         
         # Email patterns
         if profile.email and '@' in profile.email:
             username = profile.email.split('@')[0]
-            domain = profile.email.split('@')[1]
             providers = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']
-            for provider in providers:
-                passwords.add(f"{username}@{provider}")
+            yield from emit([p for p in (f"{username}@{provider}" for provider in providers)
+                             if min_len <= len(p) <= max_len])
         
         # Phone patterns
         if profile.phone:
-            clean_phone = re.sub(r'\D', '', profile.phone)
+            clean_phone = _DIGITS_RE.sub('', profile.phone)
             if len(clean_phone) >= 4:
-                passwords.add(clean_phone[-4:])
-                passwords.add(clean_phone[-6:])
-                passwords.add(clean_phone[-8:])
+                suffixes = [clean_phone[-k:] for k in (4, 6, 8)]
+                yield from emit([p for p in suffixes if min_len <= len(p) <= max_len])
         
-        # Leet speak
+        # Leet speak over the sampled candidates
         if self.config.use_leet:
             print(f"\n{Colors.CYAN}[*] Applying leet speak transformations...{Colors.ENDC}")
-            leet_passwords = set()
-            sample_size = min(len(passwords), 5000)
-            for pwd in list(passwords)[:sample_size]:
-                leet_passwords.add(self.make_leet(pwd))
-            passwords.update(leet_passwords)
-        
-        # Filter by length
-        print(f"{Colors.CYAN}[*] Filtering by length ({self.config.min_length}-{self.config.max_length})...{Colors.ENDC}")
-        passwords = {p for p in passwords if self.config.min_length <= len(p) <= self.config.max_length}
-        
+            leet_passwords = _leet_words(leet_sample, CONFIG["LEET_TABLE"])
+            # Configured leet values may be longer than one character
+            yield from emit([p for p in leet_passwords if min_len <= len(p) <= max_len])
+    
+    def generate_combinations(self, profile: Profile) -> Set[str]:
+        """Generate all password combinations with progress tracking"""
+        passwords: Set[str] = set()
+        # Drain the pipeline; the seen set is the result
+        collections.deque(self.iter_combinations(profile, passwords), maxlen=0)
         return passwords
     
     def calculate_password_strength(self, password: str) -> str:
         """Calculate password strength score"""
-        score = 0
-        
-        # Length
-        if len(password) >= 8:
-            score += 1
-        if len(password) >= 12:
-            score += 1
-        if len(password) >= 16:
-            score += 1
-        
-        # Character variety
-        if any(c.isupper() for c in password):
-            score += 1
-        if any(c.islower() for c in password):
-            score += 1
-        if any(c.isdigit() for c in password):
-            score += 1
-        if any(c in self.config.special_chars for c in password):
-            score += 2
-        
-        # Complexity
-        if len(set(password)) > len(password) * 0.7:  # High uniqueness
-            score += 1
-        
-        if score <= 3:
-            return "weak"
-        elif score <= 6:
-            return "medium"
-        else:
-            return "strong"
+        mask, unique = _char_classes(password, self.config._class_lut, self.config._special_set)
+        return _score_strength(password, mask, unique)
     
-    def generate_statistics(self, passwords: Set[str]) -> Dict:
+    def generate_statistics(self, passwords: Iterable[str]) -> Dict:
         """Generate comprehensive statistics"""
-        if not passwords:
-            return {}
-        
-        total = len(passwords)
-        lengths = [len(p) for p in passwords]
-        avg_length = sum(lengths) / total
-        
-        strength_dist = Counter()
-        for pwd in passwords:
-            strength = self.calculate_password_strength(pwd)
-            strength_dist[strength] += 1
-        
-        # Character distribution
-        char_types = {'upper': 0, 'lower': 0, 'digit': 0, 'special': 0}
-        for pwd in passwords:
-            if any(c.isupper() for c in pwd):
-                char_types['upper'] += 1
-            if any(c.islower() for c in pwd):
-                char_types['lower'] += 1
-            if any(c.isdigit() for c in pwd):
-                char_types['digit'] += 1
-            if any(c in self.config.special_chars for c in pwd):
-                char_types['special'] += 1
-        
-        return {
-            'total_passwords': total,
-            'average_length': round(avg_length, 2),
-            'min_length': min(lengths),
-            'max_length': max(lengths),
-            'strength_distribution': dict(strength_dist),
-            'weak_percentage': round(strength_dist.get('weak', 0) / total * 100, 2),
-            'medium_percentage': round(strength_dist.get('medium', 0) / total * 100, 2),
-            'strong_percentage': round(strength_dist.get('strong', 0) / total * 100, 2),
-            'char_type_distribution': char_types,
-            'generation_timestamp': datetime.now().isoformat()
-        }
+        stats = PasswordStats(self.config._class_lut, self.config._special_set)
+        collections.deque(stats.track(passwords), maxlen=0)
+        return stats.to_dict()
+    
+    def _write_txt(self, f, passwords: Iterable[str]) -> int:
+        """Write passwords one per line to an open binary stream, returning the count"""
+        passwords = iter(passwords)
+        newline = os.linesep
+        sep = newline.encode()
+        
+        # Plain files take each chunk and its separator in one scatter-gather
+        # call, skipping the copy through the stream buffer (POSIX only)
+        fd = None
+        if hasattr(os, 'writev') and isinstance(getattr(f, 'raw', None), io.FileIO):
+            f.flush()
+            fd = f.fileno()
+        
+        count = 0
+        # Join bounded chunks so each write is one C-level pass without copying the whole list
+        for chunk in iter(lambda: list(itertools.islice(passwords, TXT_CHUNK_LINES)), []):
+            data = newline.join(chunk).encode('utf-8')
+            buffers = [sep, data] if count else [data]
+            if fd is None:
+                f.writelines(buffers)
+            else:
+                _writev_all(fd, buffers)
+            count += len(chunk)
+        return count
+    
+    def _write_csv(self, f, passwords: Iterable[str]):
+        """Write passwords with strength analysis to an open text stream"""
+        writer = csv.writer(f)
+        writer.writerow(['Password', 'Length', 'Strength', 'Has_Upper', 'Has_Lower', 'Has_Digit', 'Has_Special'])
+        
+        annotate = functools.partial(_annotate_password,
+                                     class_lut=self.config._class_lut,
+                                     special_set=self.config._special_set)
+        
+        # Annotation is independent per password; spread large exports over
+        # all cores (imap keeps the rows in order)
+        if (isinstance(passwords, collections.abc.Sized) and len(passwords) >= PARALLEL_THRESHOLD
+                and (os.cpu_count() or 1) > 1):
+            with multiprocessing.Pool() as pool:
+                writer.writerows(pool.imap(annotate, passwords, chunksize=10_000))
+        else:
+            writer.writerows(map(annotate, passwords))
+    
+    def _open_gzip(self, filename: str, newline: Optional[str] = None, binary: bool = False):
+        """Open a gzip text (or binary) stream behind a 64 KB write buffer"""
+        # Wordlists barely compress, so level 1 gives the best throughput
+        raw = gzip.open(filename, 'wb', compresslevel=1)
+        buf = io.BufferedWriter(raw, buffer_size=GZIP_BUFFER_SIZE)
+        if binary:
+            return buf
+        return io.TextIOWrapper(buf, encoding='utf-8', newline=newline)
     
     def export_txt(self, passwords: Set[str], filename: str):
         """Export passwords to text file"""
-        sorted_passwords = sorted(passwords)
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(sorted_passwords))
+        if self.config.use_gzip:
+            self.export_txt_gz(passwords, filename if filename.endswith('.gz') else filename + '.gz')
+            return
+        
+        with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            self._write_txt(f, sorted(passwords))
+        print(f"{Colors.GREEN}[✓] Saved to {filename} ({len(passwords)} passwords){Colors.ENDC}")
+    
+    def export_txt_gz(self, passwords: Set[str], filename: str):
+        """Export passwords to gzip-compressed text file"""
+        with self._open_gzip(filename, binary=True) as f:
+            self._write_txt(f, sorted(passwords))
         print(f"{Colors.GREEN}[✓] Saved to {filename} ({len(passwords)} passwords){Colors.ENDC}")
     
+    def export_txt_stream(self, passwords: Iterable[str], filename: str) -> int:
+        """Export passwords to text file as they are produced, in generation order"""
+        if self.config.use_gzip:
+            filename = filename if filename.endswith('.gz') else filename + '.gz'
+            stream = self._open_gzip(filename, binary=True)
+        else:
+            stream = open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE)
+        
+        with stream as f:
+            count = self._write_txt(f, passwords)
+        print(f"{Colors.GREEN}[✓] Saved to {filename} ({count} passwords){Colors.ENDC}")
+        return count
+    
     def export_json(self, passwords: Set[str], stats: Dict, filename: str, profile: Profile):
         """Export passwords and stats to JSON"""
         data = {
@@ -648,48 +1051,71 @@ class PassKey:
             'passwords': sorted(passwords)
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Compact output keeps the encoder on its fast path; indent only on request
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if self.config.pretty_json else 0)
+        else:
+            if self.config.pretty_json:
+                payload = json.dumps(data, indent=2, ensure_ascii=False)
+            else:
+                payload = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+            payload = payload.encode('utf-8')
+        
+        with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(payload)
         print(f"{Colors.GREEN}[✓] Saved to {filename}{Colors.ENDC}")
     
     def export_csv(self, passwords: Set[str], filename: str):
         """Export passwords to CSV with strength analysis"""
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Password', 'Length', 'Strength', 'Has_Upper', 'Has_Lower', 'Has_Digit', 'Has_Special'])
-            
-            for pwd in sorted(passwords):
-                strength = self.calculate_password_strength(pwd)
-                has_upper = any(c.isupper() for c in pwd)
-                has_lower = any(c.islower() for c in pwd)
-                has_digit = any(c.isdigit() for c in pwd)
-                has_special = any(c in self.config.special_chars for c in pwd)
-                
-                writer.writerow([pwd, len(pwd), strength, has_upper, has_lower, has_digit, has_special])
+        if self.config.use_gzip:
+            self.export_csv_gz(passwords, filename if filename.endswith('.gz') else filename + '.gz')
+            return
+        
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            self._write_csv(f, sorted(passwords))
+        print(f"{Colors.GREEN}[✓] Saved to {filename}{Colors.ENDC}")
+    
+    def export_csv_gz(self, passwords: Set[str], filename: str):
+        """Export passwords to gzip-compressed CSV with strength analysis"""
+        with self._open_gzip(filename, newline='') as f:
+            self._write_csv(f, sorted(passwords))
+        print(f"{Colors.GREEN}[✓] Saved to {filename}{Colors.ENDC}")
+    
+    def export_csv_stream(self, passwords: Iterable[str], filename: str):
+        """Export passwords to CSV as they are produced, in generation order"""
+        if self.config.use_gzip:
+            filename = filename if filename.endswith('.gz') else filename + '.gz'
+            stream = self._open_gzip(filename, newline='')
+        else:
+            stream = open(filename, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE)
         
+        with stream as f:
+            self._write_csv(f, passwords)
         print(f"{Colors.GREEN}[✓] Saved to {filename}{Colors.ENDC}")
     
     def display_statistics(self, stats: Dict):
         """Display statistics in a formatted table"""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}╔══════════════════════════════════════════════════════════╗")
-        print(f"║              GENERATION STATISTICS                       ║")
-        print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-        
-        print(f"{Colors.GREEN}📊 Total Passwords:{Colors.ENDC} {Colors.BOLD}{stats['total_passwords']}{Colors.ENDC}")
-        print(f"{Colors.GREEN}📏 Average Length:{Colors.ENDC} {stats['average_length']}")
-        print(f"{Colors.GREEN}📐 Length Range:{Colors.ENDC} {stats['min_length']} - {stats['max_length']}")
-        
-        print(f"\n{Colors.BOLD}🔒 Strength Distribution:{Colors.ENDC}")
-        print(f"  {Colors.RED}● Weak:{Colors.ENDC}   {stats['weak_percentage']}% ({stats['strength_distribution'].get('weak', 0)} passwords)")
-        print(f"  {Colors.YELLOW}● Medium:{Colors.ENDC} {stats['medium_percentage']}% ({stats['strength_distribution'].get('medium', 0)} passwords)")
-        print(f"  {Colors.GREEN}● Strong:{Colors.ENDC} {stats['strong_percentage']}% ({stats['strength_distribution'].get('strong', 0)} passwords)")
-        
-        print(f"\n{Colors.BOLD}📝 Character Type Distribution:{Colors.ENDC}")
-        char_dist = stats['char_type_distribution']
-        print(f"  {Colors.CYAN}• Uppercase:{Colors.ENDC} {char_dist['upper']}")
-        print(f"  {Colors.CYAN}• Lowercase:{Colors.ENDC} {char_dist['lower']}")
-        print(f"  {Colors.CYAN}• Digits:{Colors.ENDC} {char_dist['digit']}")
-        print(f"  {Colors.CYAN}• Special:{Colors.ENDC} {char_dist['special']}")
+        # Emit the whole table with one write instead of one per line
+        with _batched_stdout():
+            print(f"\n{Colors.BOLD}{Colors.CYAN}╔══════════════════════════════════════════════════════════╗")
+            print(f"║              GENERATION STATISTICS                       ║")
+            print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+            
+            print(f"{Colors.GREEN}📊 Total Passwords:{Colors.ENDC} {Colors.BOLD}{stats['total_passwords']}{Colors.ENDC}")
+            print(f"{Colors.GREEN}📏 Average Length:{Colors.ENDC} {stats['average_length']}")
+            print(f"{Colors.GREEN}📐 Length Range:{Colors.ENDC} {stats['min_length']} - {stats['max_length']}")
+            
+            print(f"\n{Colors.BOLD}🔒 Strength Distribution:{Colors.ENDC}")
+            print(f"  {Colors.RED}● Weak:{Colors.ENDC}   {stats['weak_percentage']}% ({stats['strength_distribution'].get('weak', 0)} passwords)")
+            print(f"  {Colors.YELLOW}● Medium:{Colors.ENDC} {stats['medium_percentage']}% ({stats['strength_distribution'].get('medium', 0)} passwords)")
+            print(f"  {Colors.GREEN}● Strong:{Colors.ENDC} {stats['strong_percentage']}% ({stats['strength_distribution'].get('strong', 0)} passwords)")
+            
+            print(f"\n{Colors.BOLD}📝 Character Type Distribution:{Colors.ENDC}")
+            char_dist = stats['char_type_distribution']
+            print(f"  {Colors.CYAN}• Uppercase:{Colors.ENDC} {char_dist['upper']}")
+            print(f"  {Colors.CYAN}• Lowercase:{Colors.ENDC} {char_dist['lower']}")
+            print(f"  {Colors.CYAN}• Digits:{Colors.ENDC} {char_dist['digit']}")
+            print(f"  {Colors.CYAN}• Special:{Colors.ENDC} {char_dist['special']}")
     
     def improve_wordlist(self, input_file: str, output_file: str = None) -> Set[str]:
         """Improve existing wordlist with additional combinations"""
@@ -701,61 +1127,77 @@ class PassKey:
         print(f"\n{Colors.CYAN}[*] Loading wordlist from {input_file}...{Colors.ENDC}")
         
         try:
-            with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
-                words = [line.strip() for line in f if line.strip()]
+            words = _read_wordlist(input_file)
         except Exception as e:
             print(f"{Colors.RED}[✗] Error reading file: {e}{Colors.ENDC}")
             return set()
         
         print(f"{Colors.GREEN}[✓] Loaded {len(words)} words{Colors.ENDC}")
         
-        if len(words) > CONFIG["global"]["threshold"]:
+        # Config values used below, bound once
+        config = self.config
+        min_len, max_len = config.min_length, config.max_length
+        use_leet, use_special = config.use_leet, config.use_special_chars
+        special_chars = tuple(config.special_chars[:3])
+        
+        # Every input word is kept; only the words that seed variations are sampled.
+        # --sample sets the seed count, which also scales the per-stage limits
+        seed_count = config.sample_size or IMPROVE_SEED_WORDS
+        seeds = words
+        limit = config.sample_size or CONFIG["global"]["threshold"]
+        if len(words) > limit:
             print(f"{Colors.YELLOW}[!] Warning: Large wordlist detected ({len(words)} words){Colors.ENDC}")
-            print(f"{Colors.YELLOW}[!] This may take a while and generate many combinations{Colors.ENDC}")
-            confirm = input(f"{Colors.YELLOW}Continue? (y/N): {Colors.ENDC}").lower()
-            if confirm != 'y':
-                return set()
-        
-        enhanced = set(words)
+            if config.assume_yes:
+                print(f"{Colors.YELLOW}[!] Building variations from the first {min(seed_count, len(words))} words{Colors.ENDC}")
+            else:
+                # Fixed seed keeps runs reproducible; the sample stays in random order so
+                # every stage prefix below is itself a uniform sample
+                seeds = random.Random(0).sample(words, limit)
+                print(f"{Colors.YELLOW}[!] Building variations from a random sample of "
+                      f"{min(seed_count, limit)} words (use -y for the first words){Colors.ENDC}")
+        
+        # One hash probe per word instead of a chained comparison
+        valid_lengths = frozenset(range(min_len, max_len + 1))
+        enhanced = {w for w in words if len(w) in valid_lengths}
         
         print(f"\n{Colors.CYAN}[*] Enhancing wordlist...{Colors.ENDC}")
         
-        # Add variations
+        # Per-stage limits prevent explosion
+        case_words = seeds[:seed_count]
+        mid_words = seeds[:seed_count // 2]
+        short_words = seeds[:seed_count * 3 // 10]
+        years = tuple(str(y) for y in range(2020, 2026))
+        
+        # Length filter applied on insertion so out-of-range candidates never enter the set
+        def _add(candidates: Iterable[str], _update=enhanced.update, _valid=valid_lengths) -> None:
+            _update(c for c in candidates if len(c) in _valid)
+        
+        # Case variations; upper/lower run over the joined words in one call each
         print(f"{Colors.CYAN}  → Adding case variations...{Colors.ENDC}")
-        for word in words[:1000]:  # Limit to prevent explosion
-            enhanced.add(word.capitalize())
-            enhanced.add(word.upper())
-            enhanced.add(word.lower())
+        joined = '\n'.join(case_words)
+        _add(map(str.capitalize, case_words))
+        if joined:
+            _add(joined.upper().split('\n'))
+            _add(joined.lower().split('\n'))
         
-        # Add leet speak
-        if self.config.use_leet:
+        # Leet speak
+        if use_leet:
             print(f"{Colors.CYAN}  → Adding leet speak...{Colors.ENDC}")
-            for word in words[:500]:
-                enhanced.add(self.make_leet(word))
+            _add(_leet_words(mid_words, CONFIG["LEET_TABLE"]))
         
-        # Add years
+        # Years
         print(f"{Colors.CYAN}  → Adding year combinations...{Colors.ENDC}")
-        years = [str(y) for y in range(2020, 2026)]
-        for word in words[:500]:
-            for year in years:
-                enhanced.add(f"{word}{year}")
-                enhanced.add(f"{year}{word}")
+        enhanced.update(_concat_product(mid_words, years, min_len, max_len))
+        enhanced.update(_concat_product(mid_words, years, min_len, max_len, swap=True))
         
-        # Add special chars
-        if self.config.use_special_chars:
+        # Special chars
+        if use_special:
             print(f"{Colors.CYAN}  → Adding special characters...{Colors.ENDC}")
-            for word in words[:300]:
-                for char in self.config.special_chars[:3]:
-                    enhanced.add(f"{word}{char}")
+            enhanced.update(_concat_product(short_words, special_chars, min_len, max_len))
         
-        # Add numbers
+        # Numbers
         print(f"{Colors.CYAN}  → Adding number combinations...{Colors.ENDC}")
-        for word in words[:300]:
-            for num in ['123', '1', '12', '01', '007']:
-                enhanced.add(f"{word}{num}")
-        
-        # Filter by length
-        enhanced = {w for w in enhanced if self.config.min_length <= len(w) <= self.config.max_length}
+        enhanced.update(_concat_product(short_words, ('123', '1', '12', '01', '007'), min_len, max_len))
         
         print(f"\n{Colors.GREEN}[✓] Enhanced: {len(words)} → {len(enhanced)} passwords{Colors.ENDC}")
         
@@ -765,28 +1207,41 @@ class PassKey:
         
         return enhanced
     
-    def merge_wordlists(self, files: List[str], output_file: str):
-        """Merge multiple wordlists and remove duplicates"""
-        
-        print(f"\n{Colors.CYAN}[*] Merging {len(files)} wordlists...{Colors.ENDC}")
-        
-        merged = set()
-        
+    def _iter_wordlists(self, files: List[str]) -> Iterator[str]:
+        """Yield stripped, non-empty lines from several wordlist files in turn"""
         for file in files:
             if not os.path.isfile(file):
                 print(f"{Colors.YELLOW}[!] Warning: {file} not found, skipping{Colors.ENDC}")
                 continue
             
             try:
+                loaded = 0
+                # Streamed rather than mapped whole, so memory stays flat per file
                 with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                    words = [line.strip() for line in f if line.strip()]
-                    merged.update(words)
-                    print(f"{Colors.GREEN}[✓] Loaded {len(words)} from {file}{Colors.ENDC}")
+                    for word in map(str.strip, f):
+                        if word:
+                            loaded += 1
+                            yield word
+                print(f"{Colors.GREEN}[✓] Loaded {loaded} from {file}{Colors.ENDC}")
             except Exception as e:
                 print(f"{Colors.RED}[✗] Error reading {file}: {e}{Colors.ENDC}")
+    
+    def merge_wordlists(self, files: List[str], output_file: str):
+        """Merge multiple wordlists and remove duplicates"""
         
-        # Filter by length
-        merged = {w for w in merged if self.config.min_length <= len(w) <= self.config.max_length}
+        print(f"\n{Colors.CYAN}[*] Merging {len(files)} wordlists...{Colors.ENDC}")
+        
+        min_len, max_len = self.config.min_length, self.config.max_length
+        valid_lengths = frozenset(range(min_len, max_len + 1))
+        words = (w for w in self._iter_wordlists(files) if len(w) in valid_lengths)
+        
+        if self.config.low_memory:
+            # Sorted temporary runs bound memory while keeping deduplication exact
+            count = self.export_txt_stream(_sorted_unique(words), output_file)
+            print(f"\n{Colors.GREEN}[✓] Merged total: {count} unique passwords{Colors.ENDC}")
+            return
+        
+        merged = set(words)
         
         print(f"\n{Colors.GREEN}[✓] Merged total: {len(merged)} unique passwords{Colors.ENDC}")
         
@@ -802,34 +1257,59 @@ class PassKey:
         print(f"║              GENERATING WORDLIST                         ║")
         print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}")
         
-        start_time = time.time()
-        passwords = self.generate_combinations(profile)
-        generation_time = time.time() - start_time
-        
-        print(f"\n{Colors.GREEN}[✓] Generated {len(passwords)} unique passwords in {generation_time:.2f} seconds{Colors.ENDC}")
+        base_filename = f"{profile.name}_passwords"
         
-        stats = self.generate_statistics(passwords)
-        self.display_statistics(stats)
+        if self.config.low_memory:
+            self._run_low_memory(profile, base_filename)
+        else:
+            start_time = time.time()
+            passwords = self.generate_combinations(profile)
+            generation_time = time.time() - start_time
+            
+            print(f"\n{Colors.GREEN}[✓] Generated {len(passwords)} unique passwords in {generation_time:.2f} seconds{Colors.ENDC}")
+            
+            stats = self.generate_statistics(passwords)
+            self.display_statistics(stats)
+            
+            # Export options
+            print(f"\n{Colors.BOLD}{Colors.BLUE}╔══════════════════════════════════════════════════════════╗")
+            print(f"║              EXPORT OPTIONS                              ║")
+            print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+            
+            # Always export TXT
+            self.export_txt(passwords, f"{base_filename}.txt")
+            
+            # Ask for additional formats
+            if input(f"\n{Colors.YELLOW}Export JSON with full statistics? (y/N): {Colors.ENDC}").lower() == 'y':
+                self.export_json(passwords, stats, f"{base_filename}.json", profile)
+            
+            if input(f"{Colors.YELLOW}Export CSV with analysis? (y/N): {Colors.ENDC}").lower() == 'y':
+                self.export_csv(passwords, f"{base_filename}.csv")
         
-        # Export options
-        print(f"\n{Colors.BOLD}{Colors.BLUE}╔══════════════════════════════════════════════════════════╗")
-        print(f"║              EXPORT OPTIONS                              ║")
-        print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ Complete! Good luck with your authorized testing!{Colors.ENDC}\n")
+        print(f"{Colors.CYAN}💡 Tip: Load {base_filename}.txt{'.gz' if self.config.use_gzip else ''} into your favorite password cracking tool{Colors.ENDC}\n")
+
+    def _run_low_memory(self, profile: Profile, base_filename: str):
+        """Stream the wordlist to disk without holding it in memory"""
+        capacity = self.estimate_combinations(profile)
+        print(f"{Colors.YELLOW}[!] Low-memory mode: Bloom-filter deduplication, output in generation order{Colors.ENDC}")
         
-        base_filename = f"{profile.name}_passwords"
+        start_time = time.time()
+        # Statistics are counted while the stream is written, so they cover every password
+        stats = PasswordStats(self.config._class_lut, self.config._special_set)
+        passwords = stats.track(self.iter_combinations(profile, BloomFilter(capacity)))
+        count = self.export_txt_stream(passwords, f"{base_filename}.txt")
+        generation_time = time.time() - start_time
         
-        # Always export TXT
-        self.export_txt(passwords, f"{base_filename}.txt")
+        print(f"\n{Colors.GREEN}[✓] Generated {count} unique passwords in {generation_time:.2f} seconds{Colors.ENDC}")
         
-        # Ask for additional formats
-        if input(f"\n{Colors.YELLOW}Export JSON with full statistics? (y/N): {Colors.ENDC}").lower() == 'y':
-            self.export_json(passwords, stats, f"{base_filename}.json", profile)
+        if count:
+            self.display_statistics(stats.to_dict())
         
+        print(f"\n{Colors.YELLOW}[!] JSON export holds the full wordlist in memory; skipped in low-memory mode{Colors.ENDC}")
         if input(f"{Colors.YELLOW}Export CSV with analysis? (y/N): {Colors.ENDC}").lower() == 'y':
-            self.export_csv(passwords, f"{base_filename}.csv")
-        
-        print(f"\n{Colors.GREEN}{Colors.BOLD}✓ Complete! Good luck with your authorized testing!{Colors.ENDC}\n")
-        print(f"{Colors.CYAN}💡 Tip: Load {base_filename}.txt into your favorite password cracking tool{Colors.ENDC}\n")
+            # The pipeline is deterministic, so regenerating reproduces the TXT contents
+            self.export_csv_stream(self.iter_combinations(profile, BloomFilter(capacity)), f"{base_filename}.csv")
 
 def download_common_passwords(output_file: str = "common_passwords.txt"):
     """Download common passwords list"""
@@ -838,22 +1318,56 @@ def download_common_passwords(output_file: str = "common_passwords.txt"):
     
     print(f"{Colors.CYAN}[*] Downloading common passwords list...{Colors.ENDC}")
     
+    # Download next to the target and rename on success, so a failed
+    # transfer never leaves a truncated wordlist behind
+    target_dir = os.path.dirname(os.path.abspath(output_file))
+    tmp_path = None
     try:
-        response = urllib.request.urlopen(url, timeout=30)
-        data = response.read().decode('utf-8')
-        
-        with open(output_file, 'w') as f:
-            f.write(data)
+        with urllib.request.urlopen(url, timeout=30) as response, tempfile.NamedTemporaryFile(
+                dir=target_dir, prefix=f".{os.path.basename(output_file)}.", suffix='.part',
+                delete=False) as f:
+            tmp_path = f.name
+            # Copy the response straight to disk in large binary chunks
+            shutil.copyfileobj(response, f, EXPORT_BUFFER_SIZE)
+            # http.client reports an early EOF as a short read, not an error
+            expected = response.headers.get('Content-Length')
+            if expected is not None and f.tell() != int(expected):
+                raise IOError(f"incomplete download ({f.tell()} of {expected} bytes)")
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # NamedTemporaryFile creates 0600 files; give the result the usual umask permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, output_file)
         
         print(f"{Colors.GREEN}[✓] Downloaded to {output_file}{Colors.ENDC}")
         return True
     except Exception as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
         print(f"{Colors.RED}[✗] Download failed: {e}{Colors.ENDC}")
         return False
 
+def _positive_int(value: str) -> int:
+    """argparse type for strictly positive integers"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
 def main():
     """Main entry point"""
     
+    # Answer a bare version query before reading config or building the parser
+    if len(sys.argv) == 2 and sys.argv[1] in ('-v', '--version'):
+        print(f'PassKey v{__version__}')
+        return
+    
     # Read configuration
     read_config()
     
@@ -907,6 +1421,21 @@ Examples:
     parser.add_argument('--no-modern', action='store_true',
                         help='Disable modern terms (2025 trends)')
     
+    parser.add_argument('--gzip', action='store_true',
+                        help='Compress TXT and CSV exports with gzip')
+    
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent JSON exports (slower on large wordlists)')
+    
+    parser.add_argument('--low-mem', action='store_true',
+                        help='Stream output in batches, deduplicating with a compact Bloom filter (-i) or on-disk sort (-m), instead of holding the wordlist in memory')
+    
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help='Seed variations from the first words of a large wordlist instead of a random sample (-w)')
+    
+    parser.add_argument('--sample', type=_positive_int, metavar='N',
+                        help=f'Words that seed variations; leet/year stages use half, suffix stages 30%% (-w, default: {IMPROVE_SEED_WORDS})')
+    
     parser.add_argument('-q', '--quiet', action='store_true',
                         help='Quiet mode (no banner)')
     
@@ -926,6 +1455,12 @@ Examples:
     config.use_leet = not args.no_leet
     config.use_special_chars = not args.no_special
     config.use_modern_terms = not args.no_modern
+    config.use_gzip = args.gzip
+    config.pretty_json = args.pretty
+    config.low_memory = args.low_mem
+    config.assume_yes = args.yes
+    if args.sample is not None:
+        config.sample_size = args.sample
     
     passkey = PassKey(config)
     